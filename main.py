@@ -1,9 +1,11 @@
 import tkinter as tk
+from collections import defaultdict
 
 
 PIANO_KEYS = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 WHITE_KEYS = ["C", "D", "E", "F", "G", "A", "B"]
 BLACK_KEYS = ["C#", "D#", "F#", "G#", "A#"]
+PIANO_KEYS_INDEX = {note: index for index, note in enumerate(PIANO_KEYS)}
 
 NUMBER_OF_OCTAVES = 5
 ARCHETYPE_SIZE = NUMBER_OF_OCTAVES * 12
@@ -12,6 +14,24 @@ WHITE_KEY_WIDTH = 30
 WHITE_KEY_HEIGHT = 150
 BLACK_KEY_WIDTH = 20
 BLACK_KEY_HEIGHT = 100
+HIGHLIGHT_COLOR = "red"
+
+# Horizontal offset of each key within an octave, indexed by relative key number
+KEY_X_OFFSETS = (
+    0,    # White Key
+    WHITE_KEY_WIDTH - BLACK_KEY_WIDTH / 2,   # Black Key 1
+    WHITE_KEY_WIDTH,   # White Key 1
+    2 * WHITE_KEY_WIDTH - BLACK_KEY_WIDTH / 2,   # Black Key 2
+    2 * WHITE_KEY_WIDTH,   # White Key 2
+    3 * WHITE_KEY_WIDTH,   # White Key 3
+    4 * WHITE_KEY_WIDTH - BLACK_KEY_WIDTH / 2,   # Black Key 3
+    4 * WHITE_KEY_WIDTH,   # White Key 4
+    5 * WHITE_KEY_WIDTH - BLACK_KEY_WIDTH / 2,   # Black Key 4
+    5 * WHITE_KEY_WIDTH,   # White Key 5
+    6 * WHITE_KEY_WIDTH - BLACK_KEY_WIDTH / 2,  # Black Key 5
+    6 * WHITE_KEY_WIDTH   # White Key 6
+)
+WHITE_KEY_NUMBERS = frozenset({0, 2, 4, 5, 7, 9, 11})
 
 CHORD_VOICINGS = {
     'maj': [0, 4, 7],              # Major triad
@@ -54,6 +74,20 @@ CHORD_VOICINGS = {
     '7b9b5': [0, 4, 6, 10, 13],    # Dominant 7th flat 9 flat 5 chord
 }
 
+# Absolute key numbers of every chord voicing for every root, keyed by (chord_type, base_note)
+ROOT_VOICINGS = {
+    (chord_type, base_note): tuple(base_index + interval for interval in intervals)
+    for chord_type, intervals in CHORD_VOICINGS.items()
+    for base_index, base_note in enumerate(PIANO_KEYS)
+}
+
+SCALE_INTERVALS = {
+    'major': [2, 2, 1, 2, 2, 2, 1],
+    'melodic_minor': [2, 1, 2, 2, 2, 2, 1],
+    'natural_minor': [2, 1, 2, 2, 1, 2, 2],
+    'harmonic_minor': [2, 1, 2, 2, 1, 3, 1],
+}
+
 common_progressions = {
     'I': ['maj', 'maj7', 'maj9', 'maj11', 'maj13'],
     'ii': ['m', 'm7', 'm9', 'm11', 'm13'],
@@ -68,6 +102,14 @@ common_progressions = {
     'VII': ['m7b5', 'm9b5', 'dim', 'dim7', 'm11b9']
 }
 
+# Inverted index of common_progressions: chord name -> progression degrees containing it
+chord_progression_degrees = defaultdict(list)
+for progression, degrees in common_progressions.items():
+    for chord_name in degrees:
+        chord_progression_degrees[chord_name].append(progression)
+# Freeze the entries so lookups can hand out shared references
+chord_progression_degrees = {chord_name: tuple(degrees) for chord_name, degrees in chord_progression_degrees.items()}
+
 
 class ArchetypeKeyboard:
     def __init__(self, nr_of_keys):
@@ -75,21 +117,35 @@ class ArchetypeKeyboard:
         self.note = []
         for i in range(self.nr_of_keys):
             self.note.append(PianoKey(i))
+        self.white_notes = [note for note in self.note if not note.sharp]
+        self.black_notes = [note for note in self.note if note.sharp]
+        self.key_rectangles = []
+        self.active_keys = frozenset()
+
+    def create_keys(self):
+        self.key_rectangles = [None] * self.nr_of_keys
+
+        # Create white keys
+        for note in self.white_notes:
+            self.key_rectangles[note.key_nr] = canvas.create_rectangle(note.bbox, fill=note.fill, outline="black", tags="notes")
+
+        # Create black keys (after white keys so they stay on top)
+        for note in self.black_notes:
+            self.key_rectangles[note.key_nr] = canvas.create_rectangle(note.bbox, fill=note.fill, outline="black", tags="notes")
 
     def draw(self, keys_to_play):
-        # Draw white keys
-        for i in range(self.nr_of_keys):
-            note = PianoKey(i)
-            if not note.sharp:
-                fill_color = "red" if i in keys_to_play else note.fill
-                canvas.create_rectangle(note.bbox, fill=fill_color, outline="black", tags="notes")
+        # Create the key rectangles once, then only recolor keys whose state changed
+        if not self.key_rectangles:
+            self.create_keys()
 
-        # Draw black keys
-        for i in range(self.nr_of_keys):
-            note = PianoKey(i)
-            if note.sharp:
-                fill_color = "red" if i in keys_to_play else note.fill
-                canvas.create_rectangle(note.bbox, fill=fill_color, outline="black", tags="notes")
+        keys_to_play = frozenset(keys_to_play)
+        for key_nr in keys_to_play ^ self.active_keys:
+            if key_nr < self.nr_of_keys:
+                note = self.note[key_nr]
+                note.active = key_nr in keys_to_play
+                fill_color = HIGHLIGHT_COLOR if note.active else note.fill
+                canvas.itemconfig(self.key_rectangles[key_nr], fill=fill_color)
+        self.active_keys = keys_to_play
 
 
 class PianoKey:
@@ -98,69 +154,34 @@ class PianoKey:
         self.relative_key_nr = self.key_nr % 12
         self.key_desc = self.assign_key_description()
         self.octave = key_nr // 12
-        self.relative_key_nr = key_nr % 12
         self.active = False
 
-        x_offsets = {
-            0: 0,    # White Key
-            1: WHITE_KEY_WIDTH - BLACK_KEY_WIDTH / 2,   # Black Key 1
-            2: WHITE_KEY_WIDTH,   # White Key 1
-            3: 2 * WHITE_KEY_WIDTH - BLACK_KEY_WIDTH / 2,   # Black Key 2
-            4: 2 * WHITE_KEY_WIDTH,   # White Key 2
-            5: 3 * WHITE_KEY_WIDTH,   # White Key 3
-            6: 4 * WHITE_KEY_WIDTH - BLACK_KEY_WIDTH / 2,   # Black Key 3
-            7: 4 * WHITE_KEY_WIDTH,   # White Key 4
-            8: 5 * WHITE_KEY_WIDTH - BLACK_KEY_WIDTH / 2,   # Black Key 4
-            9: 5 * WHITE_KEY_WIDTH,   # White Key 5
-            10: 6 * WHITE_KEY_WIDTH - BLACK_KEY_WIDTH / 2,  # Black Key 5
-            11: 6 * WHITE_KEY_WIDTH   # White Key 6
-        }
-
-        x_offset = x_offsets.get(self.relative_key_nr, 0)
-        x1 = self.octave * (7 * WHITE_KEY_WIDTH) + x_offset
-        x2 = x1 + (WHITE_KEY_WIDTH if self.relative_key_nr % 12 in {0, 2, 4, 5, 7, 9, 11} else BLACK_KEY_WIDTH)
-        y2 = WHITE_KEY_HEIGHT if self.relative_key_nr % 12 in {0, 2, 4, 5, 7, 9, 11} else BLACK_KEY_HEIGHT
-
-        self.fill = "white" if y2 == WHITE_KEY_HEIGHT else "black"
-        self.sharp = self.fill == "black"
+        is_white = self.relative_key_nr in WHITE_KEY_NUMBERS
+        x1 = self.octave * (7 * WHITE_KEY_WIDTH) + KEY_X_OFFSETS[self.relative_key_nr]
+        x2 = x1 + (WHITE_KEY_WIDTH if is_white else BLACK_KEY_WIDTH)
+        y2 = WHITE_KEY_HEIGHT if is_white else BLACK_KEY_HEIGHT
+
+        self.fill = "white" if is_white else "black"
+        self.sharp = not is_white
 
         y1 = 0
         self.bbox = (x1, y1, x2, y2)
 
     def assign_key_description(self):
         # Map relative key numbers to key descriptions
-        key_descriptions = {
-            0: "C",
-            1: "C#",
-            2: "D",
-            3: "D#",
-            4: "E",
-            5: "F",
-            6: "F#",
-            7: "G",
-            8: "G#",
-            9: "A",
-            10: "A#",
-            11: "B"
-        }
-        return key_descriptions[self.relative_key_nr]
+        return PIANO_KEYS[self.relative_key_nr]
 
 
 def get_scale(base_note, scale):
-    # Define the intervals for different scales
-    if scale == 'major':
-        intervals = [2, 2, 1, 2, 2, 2, 1]
-    elif scale == 'melodic_minor':
-        intervals = [2, 1, 2, 2, 2, 2, 1]
-    elif scale == 'natural_minor':
-        intervals = [2, 1, 2, 2, 1, 2, 2]
-    elif scale == 'harmonic_minor':
-        intervals = [2, 1, 2, 2, 1, 3, 1]
-    else:
+    # Get the intervals for the requested scale
+    intervals = SCALE_INTERVALS.get(scale)
+    if intervals is None:
         raise ValueError("Invalid scale type.")
 
     # Get the index of the base_note in the PIANO_KEYS list
-    base_index = PIANO_KEYS.index(base_note.upper())
+    base_index = PIANO_KEYS_INDEX.get(base_note.upper())
+    if base_index is None:
+        raise ValueError("Invalid base note.")
     print("[d] base_index: ", base_index)
 
     # Initialize the scale with the base_note
@@ -175,13 +196,8 @@ def get_scale(base_note, scale):
     return scale_enum
 
 def find_chord_progression_degree(chord_name):
-    # Iterate through common_progressions to find the progression containing the chord's degrees
-    chord_degrees = []
-    for progression, degrees in common_progressions.items():
-        if chord_name in degrees:
-            chord_degrees.append(progression)
-
-    return chord_degrees
+    # Look up the progressions containing the chord's degrees in the precomputed index
+    return chord_progression_degrees.get(chord_name, ())
 
 
 def get_chord():
@@ -194,11 +210,9 @@ def get_chord():
     print("[d] scale: ", scale)
 
     if chord_to_play in CHORD_VOICINGS:
-        # get base_index (numeric offset of the base key) from the base_not entered by user
-        base_index = PIANO_KEYS.index(base_note) if base_note in PIANO_KEYS else None
-        if base_index is not None:
-            # get relative numeric list of keys to play, add base_index all keys_to_play to get absolute number position
-            keys_to_play = [key + base_index for key in CHORD_VOICINGS[chord_to_play]]
+        # get absolute numeric positions of the keys to play for the base_note entered by user
+        keys_to_play = ROOT_VOICINGS.get((chord_to_play, base_note))
+        if keys_to_play is not None:
             # redraw all keys
             archetype.draw(keys_to_play)
             #
@@ -217,49 +231,50 @@ def loop():
     root.after(100, loop)
 
 
-root = tk.Tk()
-root.title("Piano Keyboard")
-
-canvas = tk.Canvas(root, width=800, height=400)
-canvas.grid(row=0, column=0, columnspan=2)
-
-# Init Archetype
-archetype = ArchetypeKeyboard(ARCHETYPE_SIZE)
-
-# Create entry field for chord input
-chord_label = tk.Label(root, text="Chord:")
-chord_label.grid(row=1, column=0, sticky="e")
-chord_entry = tk.Entry(root)
-chord_entry.grid(row=1, column=1, sticky="w")
-
-# Create entry field for base note input
-note_label = tk.Label(root, text="Base Note:")
-note_label.grid(row=2, column=0, sticky="e")
-note_entry = tk.Entry(root)
-note_entry.grid(row=2, column=1, sticky="w")
-
-# Create radio buttons for selecting scale type
-scale_type_label = tk.Label(root, text="Scale Type:")
-scale_type_label.grid(row=3, column=0, sticky="e")
-
-scale_type = tk.StringVar()
-scale_type.set("major")  # Default scale type
-scale_type_frame = tk.Frame(root)
-scale_type_frame.grid(row=3, column=1, sticky="w")
-major_scale_radio = tk.Radiobutton(scale_type_frame, text="Major", variable=scale_type, value="major")
-major_scale_radio.grid(row=0, column=0)
-melodic_minor_scale_radio = tk.Radiobutton(scale_type_frame, text="Melodic Minor", variable=scale_type, value="melodic_minor")
-melodic_minor_scale_radio.grid(row=0, column=1)
-natural_minor_scale_radio = tk.Radiobutton(scale_type_frame, text="Natural Minor", variable=scale_type, value="natural_minor")
-natural_minor_scale_radio.grid(row=0, column=2)
-harmonic_minor_scale_radio = tk.Radiobutton(scale_type_frame, text="Harmonic Minor", variable=scale_type, value="harmonic_minor")
-harmonic_minor_scale_radio.grid(row=0, column=3)
-
-# Create button to trigger chord drawing
-chord_button = tk.Button(root, text="Draw Chord", command=get_chord)
-chord_button.grid(row=4, column=0, columnspan=2)
-
-# Start the loop
-loop()
-
-root.mainloop()
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Piano Keyboard")
+
+    canvas = tk.Canvas(root, width=800, height=400)
+    canvas.grid(row=0, column=0, columnspan=2)
+
+    # Init Archetype
+    archetype = ArchetypeKeyboard(ARCHETYPE_SIZE)
+
+    # Create entry field for chord input
+    chord_label = tk.Label(root, text="Chord:")
+    chord_label.grid(row=1, column=0, sticky="e")
+    chord_entry = tk.Entry(root)
+    chord_entry.grid(row=1, column=1, sticky="w")
+
+    # Create entry field for base note input
+    note_label = tk.Label(root, text="Base Note:")
+    note_label.grid(row=2, column=0, sticky="e")
+    note_entry = tk.Entry(root)
+    note_entry.grid(row=2, column=1, sticky="w")
+
+    # Create radio buttons for selecting scale type
+    scale_type_label = tk.Label(root, text="Scale Type:")
+    scale_type_label.grid(row=3, column=0, sticky="e")
+
+    scale_type = tk.StringVar()
+    scale_type.set("major")  # Default scale type
+    scale_type_frame = tk.Frame(root)
+    scale_type_frame.grid(row=3, column=1, sticky="w")
+    major_scale_radio = tk.Radiobutton(scale_type_frame, text="Major", variable=scale_type, value="major")
+    major_scale_radio.grid(row=0, column=0)
+    melodic_minor_scale_radio = tk.Radiobutton(scale_type_frame, text="Melodic Minor", variable=scale_type, value="melodic_minor")
+    melodic_minor_scale_radio.grid(row=0, column=1)
+    natural_minor_scale_radio = tk.Radiobutton(scale_type_frame, text="Natural Minor", variable=scale_type, value="natural_minor")
+    natural_minor_scale_radio.grid(row=0, column=2)
+    harmonic_minor_scale_radio = tk.Radiobutton(scale_type_frame, text="Harmonic Minor", variable=scale_type, value="harmonic_minor")
+    harmonic_minor_scale_radio.grid(row=0, column=3)
+
+    # Create button to trigger chord drawing
+    chord_button = tk.Button(root, text="Draw Chord", command=get_chord)
+    chord_button.grid(row=4, column=0, columnspan=2)
+
+    # Start the loop
+    loop()
+
+    root.mainloop()